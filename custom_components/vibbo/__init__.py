@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from homeassistant.components.frontend import add_extra_js_url
@@ -26,7 +28,11 @@ _CARD_PATH = Path(__file__).parent / "frontend" / "vibbo-feed-card.js"
 def _compute_file_hash() -> str:
     """Read the card file and return an MD5 hash (runs in executor)."""
     try:
-        return hashlib.md5(_CARD_PATH.read_bytes(), usedforsecurity=False).hexdigest()[:8]
+        with _CARD_PATH.open("rb") as file:
+            digest = hashlib.file_digest(
+                file, lambda: hashlib.md5(usedforsecurity=False)
+            )
+        return digest.hexdigest()[:8]
     except OSError:
         return "0"
 
@@ -37,12 +43,24 @@ async def _async_card_url(hass: HomeAssistant) -> str:
     return f"{FRONTEND_SCRIPT_URL}?{file_hash}"
 
 
+_LEADING_DIGITS_RE = re.compile(r"\d+")
+
+
+def _to_tuple(version: str) -> tuple[int, ...]:
+    """Convert a dotted version string (e.g. 2025.3.0b1) to a comparable tuple."""
+    return tuple(
+        int(match.group()) if (match := _LEADING_DIGITS_RE.match(x)) else 0
+        for x in version.split(".")[:3]
+    )
+
+
+_HA_VERSION_TUPLE = _to_tuple(HA_VERSION)
+
+
+@lru_cache(maxsize=8)
 def _ha_version_gte(version: str) -> bool:
     """Check if the running HA version is >= the given version string."""
-    def _to_tuple(v: str) -> tuple[int, ...]:
-        return tuple(int(x) for x in v.split(".")[:3])
-
-    return _to_tuple(HA_VERSION) >= _to_tuple(version)
+    return _HA_VERSION_TUPLE >= _to_tuple(version)
 
 
 def _get_lovelace_mode(hass: HomeAssistant) -> str:
@@ -90,6 +108,7 @@ async def _async_register_card(hass: HomeAssistant) -> None:
         return
 
     resources = _get_lovelace_resources(hass)
+    versioned_prefix = f"{FRONTEND_SCRIPT_URL}?"
 
     async def _try_register(now):
         """Attempt registration, retrying if resources aren't loaded yet."""
@@ -100,17 +119,16 @@ async def _async_register_card(hass: HomeAssistant) -> None:
             async_call_later(hass, 5, _try_register)
             return
 
-        # Check if already registered (compare path without query string)
+        # Check if already registered (any hash of the card path)
         for item in resources.async_items():
-            if item["url"].split("?")[0] == FRONTEND_SCRIPT_URL:
-                if item["url"] == card_url:
-                    _LOGGER.debug("Vibbo card already registered with current hash")
-                    return
+            url = item["url"]
+            if url == card_url:
+                _LOGGER.debug("Vibbo card already registered with current hash")
+                return
+            if url.startswith(versioned_prefix) or url == FRONTEND_SCRIPT_URL:
                 # Update to new hash
                 _LOGGER.debug(
-                    "Updating Vibbo card resource: %s -> %s",
-                    item["url"],
-                    card_url,
+                    "Updating Vibbo card resource: %s -> %s", url, card_url
                 )
                 await resources.async_update_item(
                     item["id"], {"res_type": "module", "url": card_url}
@@ -5,9 +5,12 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
-from urllib.parse import parse_qs, urlparse
 
 import aiohttp
+import orjson
+from yarl import URL
+
+from .const import minify_query
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +22,7 @@ REDIRECT_URI = f"{VIBBO_BASE}/auth/callback"
 AUDIENCE = f"{VIBBO_BASE}/"
 SCOPE = "openid email phone profile"
 
-VIBBO_ORGANIZATIONS_QUERY = """query vibboOrganizations {
+VIBBO_ORGANIZATIONS_QUERY = minify_query("""query vibboOrganizations {
   viewer {
     id
     memberships {
@@ -33,16 +36,25 @@ VIBBO_ORGANIZATIONS_QUERY = """query vibboOrganizations {
     }
     __typename
   }
-}"""
+}""")
 
-VIBBO_ORGANIZATION_QUERY = """query vibboOrganization($organizationSlug: OrganizationID!) {
+VIBBO_ORGANIZATION_QUERY = minify_query("""query vibboOrganization($organizationSlug: OrganizationID!) {
   organization(id: $organizationSlug) {
     id
     name
     slug
     __typename
   }
-}"""
+}""")
+
+_CSRF_PATTERNS = (
+    re.compile(rb'"_csrf"\s*:\s*"([^"]+)"'),
+    re.compile(rb'name="_csrf"\s+value="([^"]+)"'),
+    re.compile(rb'"_csrf","([^"]+)"'),
+    re.compile(rb"_csrf['\"]?\s*[:=]\s*['\"]([^'\"]+)"),
+)
+_STATE_RE = re.compile(rb'"state"\s*:\s*"([^"]+)"')
+_NONCE_RE = re.compile(rb'"nonce"\s*:\s*"([^"]+)"')
 
 
 class AuthError(Exception):
@@ -80,44 +92,40 @@ async def start_login(session: aiohttp.ClientSession) -> AuthSession:
         f"{VIBBO_BASE}/auth/login",
         allow_redirects=True,
     ) as resp:
-        html = await resp.text()
+        page = await resp.read()
         final_url = str(resp.url)
+        query = resp.url.query
 
     _LOGGER.debug("Login page URL: %s", final_url)
 
-    # Extract _csrf token from the HTML
-    csrf_match = (
-        re.search(r'"_csrf"\s*:\s*"([^"]+)"', html)
-        or re.search(r'name="_csrf"\s+value="([^"]+)"', html)
-        or re.search(r'"_csrf","([^"]+)"', html)
-        or re.search(r"_csrf['\"]?\s*[:=]\s*['\"]([^'\"]+)", html)
-    )
+    # Extract _csrf token from the raw HTML bytes (no need to decode it all)
+    csrf_match = None
+    for pattern in _CSRF_PATTERNS:
+        if csrf_match := pattern.search(page):
+            break
     if not csrf_match:
         raise AuthError("Could not find _csrf token in login page")
 
     # Extract state from the URL query parameters
-    parsed = urlparse(final_url)
-    qs = parse_qs(parsed.query)
-
-    state = qs.get("state", [None])[0]
+    state = query.get("state")
     if not state:
-        state_match = re.search(r'"state"\s*:\s*"([^"]+)"', html)
+        state_match = _STATE_RE.search(page)
         if state_match:
-            state = state_match.group(1)
+            state = state_match.group(1).decode()
     if not state:
         raise AuthError("Could not find state in login page")
 
-    nonce = qs.get("nonce", [None])[0]
+    nonce = query.get("nonce")
     if not nonce:
-        nonce_match = re.search(r'"nonce"\s*:\s*"([^"]+)"', html)
+        nonce_match = _NONCE_RE.search(page)
         if nonce_match:
-            nonce = nonce_match.group(1)
+            nonce = nonce_match.group(1).decode()
     if not nonce:
         raise AuthError("Could not find nonce in login page")
 
     return AuthSession(
         state=state,
-        csrf=csrf_match.group(1),
+        csrf=csrf_match.group(1).decode(),
         nonce=nonce,
         login_url=final_url,
     )
@@ -221,13 +229,9 @@ async def verify_code_and_get_cookie(
         _LOGGER.debug("Final redirect URL after verify: %s", resp.url)
 
     # Extract Vibbo session cookies from the cookie jar
-    sesid = None
-    sesid_sig = None
-    for cookie in session.cookie_jar:
-        if cookie.key == "sesid":
-            sesid = cookie.value
-        elif cookie.key == "sesid.sig":
-            sesid_sig = cookie.value
+    cookies = session.cookie_jar.filter_cookies(URL(VIBBO_BASE))
+    sesid = cookies["sesid"].value if "sesid" in cookies else None
+    sesid_sig = cookies["sesid.sig"].value if "sesid.sig" in cookies else None
 
     if not sesid or not sesid_sig:
         raise AuthError("Failed to obtain Vibbo session cookies after login")
@@ -245,11 +249,13 @@ async def _graphql(
     """Execute a Vibbo GraphQL query."""
     async with session.post(
         f"{VIBBO_BASE}/graphql?name={operation_name}",
-        json={
-            "operationName": operation_name,
-            "variables": variables or {},
-            "query": query,
-        },
+        data=orjson.dumps(
+            {
+                "operationName": operation_name,
+                "variables": variables or {},
+                "query": query,
+            }
+        ),
         headers={
             "Content-Type": "application/json",
             "Cookie": cookie,
@@ -260,7 +266,7 @@ async def _graphql(
             raise AuthError(
                 f"GraphQL query {operation_name} failed: {resp.status}"
             )
-        data = await resp.json()
+        data = orjson.loads(await resp.read())
         if "errors" in data:
             msg = data["errors"][0].get("message", str(data["errors"]))
             raise AuthError(f"GraphQL error: {msg}")
@@ -280,17 +286,16 @@ async def fetch_organizations(
     if not viewer:
         raise AuthError("No viewer data in response")
 
-    memberships = []
-    for m in viewer.get("memberships", []):
-        if m.get("vibboEnabled"):
-            memberships.append(
-                Membership(
-                    name=m["name"],
-                    slug=m["slug"],
-                    obos_company_number=m.get("obosCompanyNumber", ""),
-                    roles=m.get("roles", []),
-                )
-            )
+    memberships = [
+        Membership(
+            name=m["name"],
+            slug=m["slug"],
+            obos_company_number=m.get("obosCompanyNumber", ""),
+            roles=m.get("roles", []),
+        )
+        for m in viewer.get("memberships", ())
+        if m.get("vibboEnabled")
+    ]
 
     if not memberships:
         raise AuthError("No Vibbo-enabled organizations found for this account")
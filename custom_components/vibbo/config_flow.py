@@ -15,6 +15,10 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
 
 from .auth import (
     AuthError,
@@ -58,20 +62,26 @@ class VibboConfigFlow(ConfigFlow, domain=DOMAIN):
         self._memberships: list[Membership] = []
         self._selected_membership: Membership | None = None
 
-    async def _cleanup_session(self) -> None:
-        """Close the aiohttp session if open."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+    @callback
+    def _release_session(self) -> None:
+        """Detach the login session so its cookie jar is dropped."""
+        if self._session is not None:
+            self._session.detach()
             self._session = None
 
+    @callback
+    def async_remove(self) -> None:
+        """Release the login session when the flow is aborted or removed."""
+        self._release_session()
+        super().async_remove()
+
     async def _create_entry_for_membership(
         self, membership: Membership, scan_interval: int = DEFAULT_SCAN_INTERVAL
     ) -> ConfigFlowResult:
         """Fetch the org ID and create the config entry."""
-        async with aiohttp.ClientSession() as session:
-            org_id = await fetch_organization_id(
-                session, self._cookie, membership.slug
-            )
+        org_id = await fetch_organization_id(
+            async_get_clientsession(self.hass), self._cookie, membership.slug
+        )
 
         await self.async_set_unique_id(membership.slug)
         self._abort_if_unique_id_configured()
@@ -101,7 +111,11 @@ class VibboConfigFlow(ConfigFlow, domain=DOMAIN):
             self._phone_number = phone
 
             try:
-                self._session = aiohttp.ClientSession()
+                # Dedicated cookie jar for the Auth0 login, pooled connector
+                self._release_session()
+                self._session = async_create_clientsession(
+                    self.hass, auto_cleanup=False
+                )
                 self._auth_session = await start_login(self._session)
                 await request_sms_code(
                     self._session, self._auth_session, self._phone_number
@@ -110,11 +124,9 @@ class VibboConfigFlow(ConfigFlow, domain=DOMAIN):
             except AuthError as err:
                 _LOGGER.error("Auth error: %s", err)
                 errors["base"] = "auth_error"
-                await self._cleanup_session()
             except Exception:
                 _LOGGER.exception("Unexpected error during SMS request")
                 errors["base"] = "unknown"
-                await self._cleanup_session()
 
         return self.async_show_form(
             step_id="user",
@@ -141,13 +153,12 @@ class VibboConfigFlow(ConfigFlow, domain=DOMAIN):
                     self._phone_number,
                     code,
                 )
-                await self._cleanup_session()
+                self._release_session()
 
                 # Fetch available organizations
-                async with aiohttp.ClientSession() as session:
-                    self._memberships = await fetch_organizations(
-                        session, self._cookie
-                    )
+                self._memberships = await fetch_organizations(
+                    async_get_clientsession(self.hass), self._cookie
+                )
 
                 # If only one org, skip the selection step
                 if len(self._memberships) == 1:
@@ -165,7 +176,6 @@ class VibboConfigFlow(ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Unexpected error during verification")
                 errors["base"] = "unknown"
-                await self._cleanup_session()
 
         return self.async_show_form(
             step_id="verify_code",
@@ -1,5 +1,7 @@
 """Constants for the Vibbo integration."""
 
+import re
+
 DOMAIN = "vibbo"
 
 CONF_COOKIE = "cookie"
@@ -13,7 +15,13 @@ DEFAULT_API_VERSION = "577"
 
 GRAPHQL_URL = "https://vibbo.no/graphql?name=vibboActivityStream"
 
-GRAPHQL_QUERY = """query vibboActivityStream(
+
+def minify_query(query: str) -> str:
+    """Collapse whitespace in a GraphQL query so requests stay compact."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
+GRAPHQL_QUERY = minify_query("""query vibboActivityStream(
   $organizationId: OrganizationID!
   $limit: Int
   $filter: OrganizationActivityFilter
@@ -54,6 +62,6 @@ GRAPHQL_QUERY = """query vibboActivityStream(
       }
     }
   }
-}"""
+}""")
 
 FRONTEND_SCRIPT_URL = "/vibbo/vibbo-feed-card.js"
@@ -7,6 +7,7 @@ from datetime import timedelta
 from typing import Any
 
 import aiohttp
+import orjson
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -30,6 +31,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+_PAYLOAD_TEMPLATE: dict[str, Any] = {
+    "operationName": "vibboActivityStream",
+    "variables": {"filter": "ALL"},
+    "query": GRAPHQL_QUERY,
+}
+
 
 class VibboDataCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     """Fetch activity data from the Vibbo GraphQL API."""
@@ -42,6 +51,26 @@ class VibboDataCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self._org_id = entry.data[CONF_ORGANIZATION_ID]
         self._limit = entry.options.get("limit", DEFAULT_LIMIT)
         self._api_version = DEFAULT_API_VERSION
+        self._payload = orjson.dumps(
+            {
+                **_PAYLOAD_TEMPLATE,
+                "variables": {
+                    **_PAYLOAD_TEMPLATE["variables"],
+                    "organizationId": self._org_id,
+                    "limit": self._limit,
+                },
+            }
+        )
+        self._last_body: bytes | None = None
+        self._last_items: list[dict[str, Any]] | None = None
+        # Accept-Encoding is left to aiohttp: it only advertises encodings it
+        # can decode (gzip/deflate, plus br when a brotli module is present)
+        self._headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Home Assistant Vibbo Integration",
+            "Cookie": self._cookie,
+            "x-version": self._api_version,
+        }
 
         super().__init__(
             hass,
@@ -57,35 +86,18 @@ class VibboDataCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         """Fetch the activity stream from Vibbo."""
         session = async_get_clientsession(self.hass)
 
-        payload = {
-            "operationName": "vibboActivityStream",
-            "variables": {
-                "organizationId": self._org_id,
-                "limit": self._limit,
-                "filter": "ALL",
-            },
-            "query": GRAPHQL_QUERY,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Home Assistant Vibbo Integration",
-            "Cookie": self._cookie,
-            "x-version": self._api_version,
-        }
-
         try:
             async with session.post(
                 GRAPHQL_URL,
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+                data=self._payload,
+                headers=self._headers,
+                timeout=_TIMEOUT,
             ) as resp:
                 if resp.status != 200:
                     raise UpdateFailed(
                         f"Vibbo API returned HTTP {resp.status}"
                     )
-                data = await resp.json()
+                raw = await resp.read()
         except UpdateFailed:
             raise
         except Exception as err:
@@ -93,17 +105,27 @@ class VibboDataCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                 f"Error communicating with Vibbo: {err}"
             ) from err
 
-        if (
-            not isinstance(data, dict)
-            or "data" not in data
-            or "stream" not in data.get("data", {})
-        ):
-            errors = data.get("errors", []) if isinstance(data, dict) else []
-            if errors:
-                raise UpdateFailed(
-                    f"Vibbo API error: {errors[0].get('message', errors)}"
-                )
-            raise UpdateFailed("Invalid response from Vibbo API")
-
-        items: list[dict[str, Any]] = data["data"]["stream"].get("items", [])
-        return items
+        # Skip parsing when the feed has not changed since the last poll
+        if raw == self._last_body and self._last_items is not None:
+            return self._last_items
+
+        try:
+            data = orjson.loads(raw)
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid response from Vibbo API: {err}") from err
+
+        try:
+            items: list[dict[str, Any]] = data["data"]["stream"].get("items", [])
+        except (KeyError, TypeError, AttributeError):
+            pass
+        else:
+            self._last_body = raw
+            self._last_items = items
+            return items
+
+        errors = data.get("errors", []) if isinstance(data, dict) else []
+        if errors:
+            raise UpdateFailed(
+                f"Vibbo API error: {errors[0].get('message', errors)}"
+            )
+        raise UpdateFailed("Invalid response from Vibbo API")
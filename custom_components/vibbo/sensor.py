@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -12,6 +12,12 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import CONF_ORGANIZATION_SLUG, DOMAIN
 from .coordinator import VibboDataCoordinator
 
+_TITLE_MAX = 50
+_ELLIPSIS = "…"
+
+# Device info only depends on the entry ID, so reuse it across reloads
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,6 +32,13 @@ async def async_setup_entry(
 class VibboFeedSensor(CoordinatorEntity[VibboDataCoordinator], SensorEntity):
     """Sensor that exposes the Vibbo activity feed."""
 
+    __slots__ = (
+        "_org_slug",
+        "_cached_title",
+        "_cached_attrs",
+        "_cached_data",
+    )
+
     _attr_has_entity_name = True
     _attr_translation_key = "feed"
     _attr_icon = "mdi:newspaper-variant-outline"
@@ -37,31 +50,50 @@ class VibboFeedSensor(CoordinatorEntity[VibboDataCoordinator], SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_feed"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Vibbo",
-            manufacturer="Vibbo",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        info = _DEVICE_INFO_CACHE.get(entry.entry_id)
+        if info is None:
+            info = DeviceInfo(
+                identifiers={(DOMAIN, entry.entry_id)},
+                name="Vibbo",
+                manufacturer="Vibbo",
+                entry_type=DeviceEntryType.SERVICE,
+            )
+            _DEVICE_INFO_CACHE[entry.entry_id] = info
+        self._attr_device_info = info
+        self._org_slug: str = entry.data.get(CONF_ORGANIZATION_SLUG, "")
+        self._update_cache()
+
+    def _update_cache(self) -> None:
+        """Derive the cached state from the current coordinator data."""
+        data = self.coordinator.data
+        try:
+            title = data[0]["item"]["title"]
+        except (KeyError, IndexError, TypeError):
+            title = "No Data"
+        if len(title) > _TITLE_MAX:
+            title = f"{title[:_TITLE_MAX]}{_ELLIPSIS}"
+        self._cached_title = title
+        self._cached_attrs = {
+            "items": data or [],
+            "organization_slug": self._org_slug,
+        }
+        self._cached_data = data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state when the coordinator has new data."""
+        # The coordinator hands back the same list when the feed is unchanged
+        if self.coordinator.data is not self._cached_data:
+            self._update_cache()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str:
         """Return the latest item title as the sensor state."""
-        if self.coordinator.data:
-            title = (
-                self.coordinator.data[0].get("item", {}).get("title", "No Data")
-            )
-            return (title[:50] + "…") if len(title) > 50 else title
-        return "No Data"
+        return self._cached_title
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return feed items and org slug as attributes."""
-        return {
-            "items": self.coordinator.data or [],
-            "organization_slug": self._entry.data.get(
-                CONF_ORGANIZATION_SLUG, ""
-            ),
-        }
+        return self._cached_attrs